@@ -10,44 +10,67 @@ import os
 import sys
 import argparse
 import subprocess
-import json
 import logging
-import datetime
-import hashlib
-from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("skat.log"),
-        logging.StreamHandler()
-    ]
-)
+# Everything else is imported where it is used so that short commands such
+# as --help and verify start quickly
+
 logger = logging.getLogger("SKAT")
 
+def _configure_logging():
+    """Log to skat.log and the console."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("skat.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+def _new_hashlib(algorithm):
+    """Create a hashlib object marked as not used for security, where supported."""
+    import hashlib
+    
+    try:
+        # Integrity checks only; lets FIPS-mode OpenSSL still provide MD5/SHA1
+        return hashlib.new(algorithm, usedforsecurity=False)
+    except TypeError:
+        # Python < 3.9
+        return hashlib.new(algorithm)
+
+def _hash_segment(file_path, algorithm, offset, length):
+    """Hash one segment of a file; module-level so process pools can pickle it."""
+    import mmap
+    
+    hash_func = _new_hashlib(algorithm)
+    with open(file_path, "rb", buffering=0) as f, \
+            mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as mm:
+        hash_func.update(mm)
+    return hash_func.digest()
+
 class SleuthKitAutomationTool:
     def __init__(self):
+        import datetime
+        
         self.evidence_dir = "evidence"
         self.reports_dir = "reports"
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._evidence_prefix = self.evidence_dir + os.sep
+        self._reports_prefix = self.reports_dir + os.sep
         
         # Ensure directories exist
-        for directory in [self.evidence_dir, self.reports_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+        for directory in (self.evidence_dir, self.reports_dir):
+            os.makedirs(directory, exist_ok=True)
     
     def verify_tsk_installation(self):
         """Verify that necessary Sleuth Kit tools are installed."""
+        import shutil
+        
         required_tools = ["mmls", "fls", "icat", "blkcat", "fsstat", "mmstat"]
-        missing_tools = []
         
-        for tool in required_tools:
-            try:
-                subprocess.run([tool, "-V"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except FileNotFoundError:
-                missing_tools.append(tool)
+        # A PATH lookup is enough to detect the tools; no need to run each one
+        missing_tools = [tool for tool in required_tools if shutil.which(tool) is None]
         
         if missing_tools:
             logger.error(f"Missing required Sleuth Kit tools: {', '.join(missing_tools)}")
@@ -57,85 +80,433 @@ class SleuthKitAutomationTool:
         logger.info("Sleuth Kit installation verified")
         return True
     
-    def acquire_image(self, source, output=None):
+    def acquire_image(self, source, output=None, parallel_hash=False, tree_hash=False, digest=None,
+                      copy_method=None):
         """Create a forensic image of the source disk or partition."""
+        import datetime
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        
         if not output:
-            output = os.path.join(self.evidence_dir, f"image_{self.timestamp}.dd")
+            output = f"{self._evidence_prefix}image_{self.timestamp}.dd"
         
         logger.info(f"Creating forensic image of {source} to {output}")
         
+        # MD5 and SHA1 are always recorded; digest adds one more
+        algorithms = ["md5", "sha1"] + ([digest] if digest else [])
+        executor = None
+        
         try:
-            # Using dd for acquisition
-            cmd = ["dd", f"if={source}", f"of={output}", "bs=4M", "conv=sync,noerror", "status=progress"]
-            subprocess.run(cmd, check=True)
+            hash_funcs = {algorithm: self._new_hash(algorithm) for algorithm in algorithms}
+            if parallel_hash:
+                executor = ThreadPoolExecutor(max_workers=len(hash_funcs))
             
-            # Calculate hash for verification
-            md5_hash = self._calculate_hash(output, "md5")
-            sha1_hash = self._calculate_hash(output, "sha1")
+            # The image is written and hashed from the same stream so it never
+            # has to be read back from disk
+            copy_method = self._copy_image(source, output, hash_funcs, executor, copy_method)
+            
+            md5_hash = hash_funcs["md5"].hexdigest()
+            sha1_hash = hash_funcs["sha1"].hexdigest()
             
             # Save acquisition metadata
             metadata = {
                 "source": source,
                 "image_path": output,
                 "acquisition_date": datetime.datetime.now().isoformat(),
+                "copy_method": copy_method,
                 "md5": md5_hash,
                 "sha1": sha1_hash
             }
             
+            if digest:
+                metadata[digest] = hash_funcs[digest].hexdigest()
+            
+            if tree_hash:
+                scheme, tree_digest = self._calculate_tree_hash(output, "sha1")
+                metadata["tree_hash_scheme"] = scheme
+                metadata["tree_hash"] = tree_digest
+                logger.info(f"Tree hash ({scheme}): {tree_digest}")
+            
             with open(f"{output}.json", "w") as f:
                 json.dump(metadata, f, indent=4)
             
             logger.info(f"Image acquisition complete: {output}")
             logger.info(f"MD5: {md5_hash}")
             logger.info(f"SHA1: {sha1_hash}")
+            if digest:
+                logger.info(f"{digest.upper()}: {metadata[digest]}")
             
             return output
-        except subprocess.SubprocessError as e:
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
             logger.error(f"Image acquisition failed: {e}")
             return None
+        finally:
+            if executor:
+                executor.shutdown()
+    
+    def acquire_batch(self, manifest, parallel_hash=False, max_parallel=None):
+        """Acquire every source listed in a JSON manifest using a pool of workers."""
+        import json
+        import queue
+        import threading
+        
+        if max_parallel is not None and max_parallel < 1:
+            logger.error(f"max_parallel must be a positive integer, got {max_parallel}")
+            return None
+        
+        try:
+            with open(manifest) as f:
+                jobs = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load batch manifest {manifest}: {e}")
+            return None
+        
+        if not isinstance(jobs, list):
+            logger.error(f"Batch manifest {manifest} must contain a JSON list")
+            return None
+        for index, job in enumerate(jobs):
+            if (not isinstance(job, dict) or not isinstance(job.get("source"), str)
+                    or not isinstance(job.get("output", ""), (str, type(None)))):
+                logger.error(f"Invalid manifest entry {index}: expected "
+                             f"{{\"source\": <path>, \"output\": <path>}}, got {job!r}")
+                return None
+        
+        jobs = [(job["source"], job.get("output") or f"{self._evidence_prefix}image_{index}_{self.timestamp}.dd")
+                for index, job in enumerate(jobs)]
+        
+        # Concurrent jobs writing the same file would silently destroy evidence
+        sources = {os.path.realpath(source) for source, _ in jobs}
+        outputs = {}
+        for index, (source, output) in enumerate(jobs):
+            path = os.path.realpath(output)
+            if path in outputs:
+                logger.error(f"Invalid manifest entry {index}: output {output} is also used by entry {outputs[path]}")
+                return None
+            if path in sources:
+                logger.error(f"Invalid manifest entry {index}: output {output} is also a source")
+                return None
+            outputs[path] = index
+        
+        logger.info(f"Starting batch acquisition of {len(jobs)} sources from {manifest}")
+        
+        work = queue.Queue()
+        for index, (source, output) in enumerate(jobs):
+            work.put((index, source, output))
+        
+        # Cap concurrency at the number of independent disks/controllers to
+        # avoid several acquisitions contending for the same spindle
+        workers = min(len(jobs), os.cpu_count() or 1, max_parallel or len(jobs))
+        results = [None] * len(jobs)
+        
+        def worker():
+            while True:
+                try:
+                    index, source, output = work.get_nowait()
+                except queue.Empty:
+                    return
+                image = self.acquire_image(source, output, parallel_hash)
+                if image:
+                    with open(f"{image}.json") as f:
+                        results[index] = json.load(f)
+                else:
+                    results[index] = {"source": source, "image_path": output, "error": "acquisition failed"}
+        
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        summary_file = f"{self._reports_prefix}batch_summary_{self.timestamp}.json"
+        with open(summary_file, "w") as f:
+            json.dump({"manifest": manifest, "timestamp": self.timestamp, "images": results}, f, indent=4)
+        
+        failed = sum(1 for result in results if result is None or "error" in result)
+        logger.info(f"Batch acquisition complete ({failed} failed). Summary saved to {summary_file}")
+        return summary_file
     
-    def _calculate_hash(self, file_path, algorithm):
-        """Calculate hash of a file using the specified algorithm."""
-        hash_func = None
-        if algorithm == "md5":
-            hash_func = hashlib.md5()
-        elif algorithm == "sha1":
-            hash_func = hashlib.sha1()
+    def _copy_image(self, source, output, hash_funcs, executor=None, copy_method=None):
+        """Copy the source into the image and return the copy method used.
+        
+        The method affects the image contents: dd (conv=sync) pads the last
+        block to 4 MiB, while the kernel and native copies write exactly the
+        source size. The same disk can therefore hash differently depending on
+        the method, which is why it is recorded in the metadata.
+        """
+        seekable = self._is_seekable(source)
+        if copy_method is None:
+            if hasattr(os, "copy_file_range") and seekable:
+                copy_method = "kernel"
+            elif hasattr(os, "preadv") and seekable:
+                copy_method = "native"
+            else:
+                copy_method = "dd"
+        elif copy_method in ("kernel", "native") and not seekable:
+            raise ValueError(f"The {copy_method} copy method needs a regular file or block device source")
+        
+        if copy_method == "kernel":
+            try:
+                self._copy_zero_copy(source, output, hash_funcs, executor)
+                return "kernel"
+            except OSError as e:
+                # e.g. unreadable sectors, which the buffered copier zero-fills
+                logger.warning(f"Zero-copy acquisition failed ({e}); retrying with buffered copy")
+                for algorithm in hash_funcs:
+                    hash_funcs[algorithm] = self._new_hash(algorithm)
+                copy_method = "native"
+        
+        if copy_method == "native":
+            self._copy_native(source, output, hash_funcs, executor)
         else:
-            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+            self._copy_dd(source, output, hash_funcs, executor)
+        return copy_method
+    
+    def _is_seekable(self, source):
+        """Check whether the source is a regular file or block device."""
+        import stat
+        
+        try:
+            mode = os.stat(source).st_mode
+        except OSError:
+            return False
+        return stat.S_ISREG(mode) or stat.S_ISBLK(mode)
+    
+    def _copy_dd(self, source, output, hash_funcs, executor=None):
+        """Copy the source with dd, hashing its output as it is written."""
+        cmd = ["dd", f"if={source}", "bs=4M", "conv=sync,noerror", "status=progress"]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        with proc, open(output, "wb") as f:
+            for chunk in iter(lambda: proc.stdout.read(4 << 20), b""):
+                f.write(chunk)
+                self._update_hashes(hash_funcs, chunk, executor)
+            f.flush()
+            self._drop_written_pages(f.fileno())
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+    
+    def _copy_zero_copy(self, source, output, hash_funcs, executor=None, segment_size=1 << 30):
+        """Copy the source inside the kernel, hashing each segment once it is written.
+        
+        Regular files use copy_file_range and block devices use sendfile, so the
+        copy never passes through user space. A hashing thread maps each finished
+        segment of the image and hashes it while the next one is being copied.
+        """
+        import mmap
+        import stat
+        from concurrent.futures import ThreadPoolExecutor
+        
+        is_regular = stat.S_ISREG(os.stat(source).st_mode)
+        
+        def hash_segment(offset, length):
+            with open(output, "rb", buffering=0) as f:
+                with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as mm:
+                    self._update_hashes(hash_funcs, mm, executor)
+                # Neither side of a hashed segment is read again
+                self._drop_written_pages(f.fileno(), offset, length)
+                self._fadvise(src.fileno(), "POSIX_FADV_DONTNEED", offset, length)
+        
+        with open(source, "rb", buffering=0) as src, open(output, "wb", buffering=0) as out, \
+                ThreadPoolExecutor(max_workers=1) as hasher:
+            self._fadvise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+            futures = []
+            offset = 0
+            while True:
+                copied = 0
+                while copied < segment_size:
+                    if is_regular:
+                        n = os.copy_file_range(src.fileno(), out.fileno(), segment_size - copied)
+                    else:
+                        n = os.sendfile(out.fileno(), src.fileno(), offset + copied, segment_size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+                if copied:
+                    futures.append(hasher.submit(hash_segment, offset, copied))
+                    offset += copied
+                if copied < segment_size:
+                    break
+            for future in futures:
+                future.result()
+    
+    def _copy_native(self, source, output, hash_funcs, executor=None,
+                     block_size=4 << 20, buffer_count=16):
+        """Copy the source in-process, hashing each block as it is written.
+        
+        A reader thread keeps a pool of preallocated buffers filled with
+        positional reads while the main thread writes and hashes them, so
+        reading the source overlaps with writing the image. Unreadable blocks
+        are zero-filled, like dd with conv=sync,noerror.
+        """
+        import queue
+        import threading
+        
+        free_buffers = queue.Queue()
+        filled_buffers = queue.Queue()
+        for _ in range(buffer_count):
+            free_buffers.put(bytearray(block_size))
+        
+        src_fd = os.open(source, os.O_RDONLY)
+        
+        def reader():
+            # Stop at the reported size so a failing device cannot produce
+            # an endless run of zero-filled blocks
+            try:
+                offset = 0
+                while offset < src_size:
+                    buf = free_buffers.get()
+                    if buf is None:
+                        return
+                    wanted = min(block_size, src_size - offset)
+                    try:
+                        length = os.preadv(src_fd, [memoryview(buf)[:wanted]], offset)
+                    except OSError as e:
+                        logger.warning(f"Read error at offset {offset}: {e}; zero-filling {wanted} bytes")
+                        buf[:wanted] = bytes(wanted)
+                        length = wanted
+                    if length == 0:
+                        break
+                    filled_buffers.put((buf, length))
+                    offset += length
+                filled_buffers.put(None)
+            except Exception as e:
+                # Hand the error to the main thread rather than leaving it waiting
+                filled_buffers.put(e)
         
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b""):
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        try:
+            src_size = os.lseek(src_fd, 0, os.SEEK_END)
+            self._fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+            reader_thread.start()
+            with open(output, "wb") as f:
+                while True:
+                    item = filled_buffers.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    buf, length = item
+                    chunk = memoryview(buf)[:length]
+                    f.write(chunk)
+                    self._update_hashes(hash_funcs, chunk, executor)
+                    free_buffers.put(buf)
+                # The source and image are not read again, so drop their cached pages
+                f.flush()
+                self._drop_written_pages(f.fileno())
+                self._fadvise(src_fd, "POSIX_FADV_DONTNEED")
+        finally:
+            # Unblock the reader if we stopped early, then release the source
+            free_buffers.put(None)
+            if reader_thread.ident is not None:
+                reader_thread.join()
+            os.close(src_fd)
+    
+    def _new_hash(self, algorithm):
+        """Create a hash object for the specified algorithm."""
+        if algorithm in ("md5", "sha1", "sha256"):
+            return _new_hashlib(algorithm)
+        elif algorithm == "blake3":
+            try:
+                import blake3
+            except ImportError:
+                raise ValueError("BLAKE3 hashing requires the blake3 package (pip install blake3)")
+            # BLAKE3 is a tree hash internally and can use all cores
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    
+    def _calculate_tree_hash(self, file_path, algorithm, segment_size=64 << 20, workers=None):
+        """Calculate a parallel tree hash of a file.
+        
+        The file is split into fixed-size segments that are hashed on separate
+        cores; the result is the hash of the concatenated segment digests. This is
+        not the same value as a plain hash of the file, so the scheme name is
+        returned alongside the digest for recording in the metadata.
+        """
+        import mmap
+        from concurrent.futures import ProcessPoolExecutor
+        
+        if segment_size % mmap.ALLOCATIONGRANULARITY:
+            raise ValueError(f"Segment size must be a multiple of {mmap.ALLOCATIONGRANULARITY}")
+        
+        top_hash = self._new_hash(algorithm)
+        scheme = f"{algorithm}-tree-{segment_size >> 20}M"
+        file_size = os.path.getsize(file_path)
+        segments = [(offset, min(segment_size, file_size - offset))
+                    for offset in range(0, file_size, segment_size)]
+        
+        if segments:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                futures = [executor.submit(_hash_segment, file_path, algorithm, offset, length)
+                           for offset, length in segments]
+                top_hash.update(b"".join(future.result() for future in futures))
+        
+        return scheme, top_hash.hexdigest()
+    
+    def _fadvise(self, fd, advice, offset=0, length=0):
+        """Give the kernel an access-pattern hint for a file range, where supported.
+        
+        A length of 0 covers everything from offset to the end of the file.
+        """
+        if hasattr(os, "posix_fadvise") and hasattr(os, advice):
+            os.posix_fadvise(fd, offset, length, getattr(os, advice))
+    
+    def _drop_written_pages(self, fd, offset=0, length=0):
+        """Sync written image data to disk, then drop it from the page cache.
+        
+        Linux only evicts clean pages, so the sync is what lets the hint take
+        effect; it also makes the evidence durable before its hashes are recorded.
+        """
+        getattr(os, "fdatasync", os.fsync)(fd)
+        self._fadvise(fd, "POSIX_FADV_DONTNEED", offset, length)
+    
+    def _update_hashes(self, hash_funcs, chunk, executor=None):
+        """Feed a chunk to every hash object, optionally one thread per digest."""
+        if executor is None:
+            for hash_func in hash_funcs.values():
                 hash_func.update(chunk)
+            return
         
-        return hash_func.hexdigest()
+        futures = [executor.submit(hash_func.update, chunk) for hash_func in hash_funcs.values()]
+        for future in futures:
+            future.result()
+    
+    def _image_stem(self, image_path):
+        """Return the image file name without its extension."""
+        from pathlib import Path
+        return Path(image_path).stem
+    
+    def _remove_partial(self, path):
+        """Delete an incomplete report so it is not mistaken for a real one."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
     
-    def analyze_partitions(self, image_path):
+    def analyze_partitions(self, image_path, stem=None):
         """Analyze partition structure of the image."""
-        output_file = os.path.join(self.reports_dir, f"partitions_{Path(image_path).stem}_{self.timestamp}.txt")
+        stem = stem or self._image_stem(image_path)
+        output_file = f"{self._reports_prefix}partitions_{stem}_{self.timestamp}.txt"
         
         logger.info(f"Analyzing partitions in {image_path}")
         
         try:
-            # Run mmls to get partition layout
-            result = subprocess.run(["mmls", image_path], check=True, 
-                                    stdout=subprocess.PIPE, text=True)
-            
+            # Run mmls to get partition layout, streaming its output to the report
             with open(output_file, "w") as f:
                 f.write(f"Partition Analysis for {image_path}\n")
                 f.write("=" * 80 + "\n")
-                f.write(result.stdout)
+                f.flush()
+                subprocess.run(["mmls", image_path], check=True, stdout=f)
             
             logger.info(f"Partition analysis saved to {output_file}")
             return output_file
-        except subprocess.SubprocessError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             logger.error(f"Partition analysis failed: {e}")
+            self._remove_partial(output_file)
             return None
     
-    def extract_filesystem_stats(self, image_path, offset=0):
+    def extract_filesystem_stats(self, image_path, offset=0, stem=None):
         """Extract filesystem statistics from the image."""
-        output_file = os.path.join(self.reports_dir, f"fsstat_{Path(image_path).stem}_{self.timestamp}.txt")
+        stem = stem or self._image_stem(image_path)
+        output_file = f"{self._reports_prefix}fsstat_{stem}_{self.timestamp}.txt"
         
         logger.info(f"Extracting filesystem stats from {image_path} at offset {offset}")
         
@@ -146,50 +517,52 @@ class SleuthKitAutomationTool:
                 cmd.extend(["-o", str(offset)])
             cmd.append(image_path)
             
-            result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, text=True)
-            
             with open(output_file, "w") as f:
                 f.write(f"Filesystem Analysis for {image_path} (Offset: {offset})\n")
                 f.write("=" * 80 + "\n")
-                f.write(result.stdout)
+                f.flush()
+                subprocess.run(cmd, check=True, stdout=f)
             
             logger.info(f"Filesystem analysis saved to {output_file}")
             return output_file
-        except subprocess.SubprocessError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             logger.error(f"Filesystem analysis failed: {e}")
+            self._remove_partial(output_file)
             return None
     
-    def list_files(self, image_path, offset=0, recursive=True):
+    def list_files(self, image_path, offset=0, recursive=True, stem=None):
         """List files in the filesystem from the image."""
-        output_file = os.path.join(self.reports_dir, f"filelist_{Path(image_path).stem}_{self.timestamp}.txt")
+        stem = stem or self._image_stem(image_path)
+        output_file = f"{self._reports_prefix}filelist_{stem}_{self.timestamp}.txt"
         
         logger.info(f"Listing files from {image_path} at offset {offset}")
         
         try:
             # Run fls to list files
-            cmd = ["fls", "-r" if recursive else ""]
+            cmd = ["fls"]
+            if recursive:
+                cmd.append("-r")
             if offset > 0:
                 cmd.extend(["-o", str(offset)])
             cmd.append(image_path)
             
-            result = subprocess.run([c for c in cmd if c], check=True, 
-                                   stdout=subprocess.PIPE, text=True)
-            
             with open(output_file, "w") as f:
                 f.write(f"File Listing for {image_path} (Offset: {offset})\n")
                 f.write("=" * 80 + "\n")
-                f.write(result.stdout)
+                f.flush()
+                subprocess.run(cmd, check=True, stdout=f)
             
             logger.info(f"File listing saved to {output_file}")
             return output_file
-        except subprocess.SubprocessError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             logger.error(f"File listing failed: {e}")
+            self._remove_partial(output_file)
             return None
     
     def extract_file(self, image_path, inode, output=None, offset=0):
         """Extract a specific file by inode from the image."""
         if not output:
-            output = os.path.join(self.evidence_dir, f"inode_{inode}_{self.timestamp}.bin")
+            output = f"{self._evidence_prefix}inode_{inode}_{self.timestamp}.bin"
         
         logger.info(f"Extracting inode {inode} from {image_path} to {output}")
         
@@ -209,10 +582,11 @@ class SleuthKitAutomationTool:
             logger.error(f"File extraction failed: {e}")
             return None
     
-    def timeline_analysis(self, image_path, offset=0):
+    def timeline_analysis(self, image_path, offset=0, stem=None):
         """Create a timeline of file activity."""
-        body_file = os.path.join(self.reports_dir, f"body_file_{Path(image_path).stem}_{self.timestamp}")
-        timeline_file = os.path.join(self.reports_dir, f"timeline_{Path(image_path).stem}_{self.timestamp}.txt")
+        stem = stem or self._image_stem(image_path)
+        body_file = f"{self._reports_prefix}body_file_{stem}_{self.timestamp}"
+        timeline_file = f"{self._reports_prefix}timeline_{stem}_{self.timestamp}.txt"
         
         logger.info(f"Creating timeline for {image_path}")
         
@@ -223,12 +597,34 @@ class SleuthKitAutomationTool:
                 cmd.extend(["-o", str(offset)])
             cmd.append(image_path)
             
-            with open(body_file, "w") as f:
-                subprocess.run(cmd, check=True, stdout=f)
+            # Pipe the body file into mactime as fls produces it, keeping a copy
+            # on disk for the audit trail instead of writing then re-reading it
+            fls_proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+            with fls_proc, open(body_file, "wb") as body, open(timeline_file, "w") as f:
+                mactime_proc = subprocess.Popen(["mactime"], stdin=subprocess.PIPE, stdout=f)
+                with mactime_proc:
+                    feeding = True
+                    for chunk in iter(lambda: fls_proc.stdout.read(1 << 16), b""):
+                        body.write(chunk)
+                        if feeding:
+                            try:
+                                mactime_proc.stdin.write(chunk)
+                            except BrokenPipeError:
+                                # mactime exited early; keep draining fls so the
+                                # body file stays complete
+                                feeding = False
+                    try:
+                        # Closing flushes the buffered tail; the raw pipe is closed
+                        # even if that fails, so Popen's own close is then a no-op
+                        mactime_proc.stdin.close()
+                    except BrokenPipeError:
+                        pass
             
-            # Create timeline from body file
-            with open(timeline_file, "w") as f:
-                subprocess.run(["mactime", "-b", body_file], check=True, stdout=f)
+            # A failed mactime is the root cause of any broken pipe, so report it first
+            if mactime_proc.returncode != 0:
+                raise subprocess.CalledProcessError(mactime_proc.returncode, ["mactime"])
+            if fls_proc.returncode != 0:
+                raise subprocess.CalledProcessError(fls_proc.returncode, cmd)
             
             logger.info(f"Timeline analysis saved to {timeline_file}")
             return timeline_file
@@ -238,24 +634,94 @@ class SleuthKitAutomationTool:
     
     def run_autopsy(self, evidence_path):
         """Launch Autopsy with the specified evidence."""
+        import shutil
+        
         logger.info(f"Attempting to launch Autopsy with {evidence_path}")
         
+        # Check if Autopsy is installed
+        autopsy_bin = shutil.which("autopsy")
+        if not autopsy_bin:
+            logger.error("Failed to launch Autopsy. Is it installed?")
+            return False
+        
         try:
-            # Check if Autopsy is installed
-            subprocess.run(["which", "autopsy"], check=True, stdout=subprocess.PIPE)
-            
             # Launch Autopsy (actual implementation may vary based on system)
-            subprocess.Popen(["autopsy", evidence_path])
+            subprocess.Popen([autopsy_bin, evidence_path])
             
             logger.info("Autopsy launched successfully")
             return True
-        except subprocess.SubprocessError:
+        except (subprocess.SubprocessError, OSError):
             logger.error("Failed to launch Autopsy. Is it installed?")
             return False
     
+    def _timeline_and_file_list(self, image_path, offset=0, stem=None):
+        """Create a timeline and derive the file listing from its body file.
+        
+        The body file already holds every path found by the recursive fls walk,
+        so this saves a second traversal of the filesystem.
+        """
+        stem = stem or self._image_stem(image_path)
+        timeline_file = self.timeline_analysis(image_path, offset, stem)
+        if not timeline_file:
+            return None, None
+        
+        body_file = f"{self._reports_prefix}body_file_{stem}_{self.timestamp}"
+        output_file = f"{self._reports_prefix}filelist_{stem}_{self.timestamp}.txt"
+        
+        try:
+            self._write_file_list(body_file, output_file, image_path, offset)
+            logger.info(f"File listing saved to {output_file}")
+            return timeline_file, output_file
+        except (OSError, ValueError, IndexError) as e:
+            logger.error(f"File listing failed: {e}")
+            self._remove_partial(output_file)
+            return timeline_file, None
+    
+    def _write_file_list(self, body_file, output_file, image_path, offset=0):
+        """Write an fls-style file listing from a body file."""
+        # fls writes names as raw bytes (deleted and FAT entries are often not
+        # UTF-8), so carry undecodable bytes through unchanged
+        with open(body_file, errors="surrogateescape") as body, \
+                open(output_file, "w", errors="surrogateescape") as f:
+            f.write(f"File Listing for {image_path} (Offset: {offset})\n")
+            f.write("=" * 80 + "\n")
+            for line in body:
+                entry = self._file_list_entry(line)
+                if entry:
+                    f.write(entry + "\n")
+    
+    def _file_list_entry(self, line):
+        """Convert one body file line to an fls listing line, or None to skip it."""
+        # MD5|name|inode|mode|UID|GID|size|atime|mtime|ctime|crtime
+        fields = line.rstrip("\r\n").split("|", 1)
+        if len(fields) < 2:
+            return None
+        fields = fields[1].rsplit("|", 9)
+        if len(fields) < 10:
+            return None
+        name, inode, mode = fields[:3]
+        
+        # fls -m appends status suffixes that fls -r reports differently
+        flags = set()
+        for suffix in (" (deleted)", " (deleted-realloc)", " (realloc)", " ($FILE_NAME)"):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                flags.add(suffix)
+        
+        # NTFS $FILE_NAME attributes duplicate the file's own entry
+        if " ($FILE_NAME)" in flags:
+            return None
+        deleted = " (deleted)" in flags or " (deleted-realloc)" in flags
+        realloc = " (deleted-realloc)" in flags or " (realloc)" in flags
+        return f"{mode[:3]}{' *' if deleted else ''} {inode}{'(realloc)' if realloc else ''}:\t{name}"
+    
     def run_full_analysis(self, image_path, offset=0):
         """Run a full analysis workflow on the image."""
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        
         logger.info(f"Starting full analysis on {image_path}")
+        stem = self._image_stem(image_path)
         
         results = {
             "image": image_path,
@@ -264,26 +730,36 @@ class SleuthKitAutomationTool:
             "reports": {}
         }
         
-        # Analyze partitions
-        results["reports"]["partitions"] = self.analyze_partitions(image_path)
-        
-        # Extract filesystem information
-        results["reports"]["filesystem"] = self.extract_filesystem_stats(image_path, offset)
-        
-        # List files
-        results["reports"]["file_list"] = self.list_files(image_path, offset)
-        
-        # Create timeline
-        results["reports"]["timeline"] = self.timeline_analysis(image_path, offset)
+        # The reports are independent, so run their TSK tools concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            partitions = executor.submit(self.analyze_partitions, image_path, stem)
+            filesystem = executor.submit(self.extract_filesystem_stats, image_path, offset, stem)
+            timeline = executor.submit(self._timeline_and_file_list, image_path, offset, stem)
+            
+            results["reports"]["partitions"] = partitions.result()
+            results["reports"]["filesystem"] = filesystem.result()
+            timeline_file, file_list = timeline.result()
+            results["reports"]["file_list"] = file_list
+            results["reports"]["timeline"] = timeline_file
         
         # Save analysis results
-        summary_file = os.path.join(self.reports_dir, f"analysis_summary_{Path(image_path).stem}_{self.timestamp}.json")
+        summary_file = f"{self._reports_prefix}analysis_summary_{stem}_{self.timestamp}.json"
         with open(summary_file, "w") as f:
             json.dump(results, f, indent=4)
         
         logger.info(f"Full analysis complete. Summary saved to {summary_file}")
         return summary_file
 
+def _positive_int(value):
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='Sleuth Kit Automation Tool (SKAT)')
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
@@ -295,6 +771,22 @@ def main():
     acquire_parser = subparsers.add_parser('acquire', help='Create forensic image')
     acquire_parser.add_argument('source', help='Source disk or partition')
     acquire_parser.add_argument('--output', '-o', help='Output image file')
+    acquire_parser.add_argument('--parallel-hash', action='store_true',
+                                help='Update MD5 and SHA1 concurrently on separate threads')
+    acquire_parser.add_argument('--tree-hash', action='store_true',
+                                help='Also record a parallel SHA1 tree hash (64 MiB segments)')
+    acquire_parser.add_argument('--digest', choices=['sha256', 'blake3'],
+                                help='Additional digest to record alongside MD5 and SHA1 (blake3 needs the blake3 package)')
+    acquire_parser.add_argument('--copy-method', choices=['kernel', 'native', 'dd'],
+                                help='Force a copy method (default: best available; dd pads the last block to 4 MiB)')
+    
+    # Batch acquire command
+    batch_parser = subparsers.add_parser('batch', help='Create forensic images of several sources')
+    batch_parser.add_argument('manifest', help='JSON list of {"source": ..., "output": ...} entries')
+    batch_parser.add_argument('--max-parallel', '-j', type=_positive_int,
+                              help='Maximum concurrent acquisitions (e.g. number of disk controllers)')
+    batch_parser.add_argument('--parallel-hash', action='store_true',
+                              help='Update MD5 and SHA1 concurrently on separate threads')
     
     # Analyze partitions command
     part_parser = subparsers.add_parser('partitions', help='Analyze partition structure')
@@ -333,6 +825,7 @@ def main():
     full_parser.add_argument('--offset', '-o', type=int, default=0, help='Partition offset')
     
     args = parser.parse_args()
+    _configure_logging()
     
     # Create tool instance
     tool = SleuthKitAutomationTool()
@@ -341,7 +834,10 @@ def main():
     if args.command == 'verify':
         tool.verify_tsk_installation()
     elif args.command == 'acquire':
-        tool.acquire_image(args.source, args.output)
+        tool.acquire_image(args.source, args.output, args.parallel_hash, args.tree_hash, args.digest,
+                           args.copy_method)
+    elif args.command == 'batch':
+        tool.acquire_batch(args.manifest, args.parallel_hash, args.max_parallel)
     elif args.command == 'partitions':
         tool.analyze_partitions(args.image)
     elif args.command == 'fsstat':
@@ -51,6 +51,216 @@ def test_verify_command():
         print(f"✗ Verify command error: {e}")
         return False
 
+def test_acquire_round_trip():
+    """Test that each copy method produces a correct image and metadata."""
+    print("Testing image acquisition...")
+    import hashlib
+    import json
+    import skat
+    
+    tool = skat.SleuthKitAutomationTool()
+    data = os.urandom((5 << 20) + 77)
+    workdir = tempfile.mkdtemp()
+    source = os.path.join(workdir, "source.bin")
+    with open(source, "wb") as f:
+        f.write(data)
+    
+    try:
+        passed = True
+        for method in ("kernel", "native", "dd"):
+            output = os.path.join(workdir, f"image_{method}.dd")
+            if tool.acquire_image(source, output, copy_method=method) != output:
+                print(f"✗ {method}: acquisition failed")
+                passed = False
+                continue
+            
+            with open(output, "rb") as f:
+                image = f.read()
+            with open(f"{output}.json") as f:
+                metadata = json.load(f)
+            
+            # dd runs with conv=sync and pads the last block to 4 MiB
+            expected = data
+            if method == "dd":
+                expected += bytes(-len(data) % (4 << 20))
+            
+            if image != expected:
+                print(f"✗ {method}: image does not match source")
+                passed = False
+            elif (metadata["md5"] != hashlib.md5(image).hexdigest()
+                  or metadata["sha1"] != hashlib.sha1(image).hexdigest()
+                  or metadata["copy_method"] != method):
+                print(f"✗ {method}: metadata mismatch: {metadata}")
+                passed = False
+            else:
+                print(f"✓ {method}: image and hashes match")
+        return passed
+    finally:
+        shutil.rmtree(workdir)
+
+def test_batch_acquisition():
+    """Test batch acquisition from a manifest and its validation."""
+    print("Testing batch acquisition...")
+    import hashlib
+    import json
+    import skat
+    
+    tool = skat.SleuthKitAutomationTool()
+    workdir = tempfile.mkdtemp()
+    sources = []
+    for index, size in enumerate(((1 << 20) + 13, 4096)):
+        source = os.path.join(workdir, f"source_{index}.bin")
+        with open(source, "wb") as f:
+            f.write(os.urandom(size))
+        sources.append(source)
+    outputs = [os.path.join(workdir, f"image_{index}.dd") for index in range(len(sources))]
+    
+    def batch(jobs):
+        manifest = os.path.join(workdir, "manifest.json")
+        with open(manifest, "w") as f:
+            json.dump(jobs, f)
+        return tool.acquire_batch(manifest)
+    
+    try:
+        passed = True
+        summary_file = batch([{"source": source, "output": output}
+                              for source, output in zip(sources, outputs)])
+        if not summary_file:
+            print("✗ Batch acquisition failed")
+            return False
+        try:
+            with open(summary_file) as f:
+                summary = json.load(f)
+        finally:
+            os.remove(summary_file)
+        
+        for source, output, result in zip(sources, outputs, summary["images"]):
+            with open(source, "rb") as f:
+                data = f.read()
+            with open(output, "rb") as f:
+                image = f.read()
+            if image != data:
+                print(f"✗ {output}: image does not match source")
+                passed = False
+            elif (result["md5"] != hashlib.md5(data).hexdigest()
+                  or result["sha1"] != hashlib.sha1(data).hexdigest()):
+                print(f"✗ {output}: summary hashes mismatch: {result}")
+                passed = False
+            else:
+                print(f"✓ {os.path.basename(output)}: image and summary hashes match")
+        
+        invalid = {
+            "manifest is not a list": {"source": sources[0], "output": outputs[0]},
+            "entry without source": [{"output": outputs[0]}],
+            "duplicate outputs": [{"source": sources[0], "output": outputs[0]},
+                                  {"source": sources[1], "output": os.path.join(workdir, ".", "image_0.dd")}],
+            "output is a source": [{"source": sources[0], "output": sources[1]},
+                                   {"source": sources[1], "output": outputs[1]}],
+        }
+        for case, jobs in invalid.items():
+            if batch(jobs) is not None:
+                print(f"✗ {case}: manifest was accepted")
+                passed = False
+            else:
+                print(f"✓ {case}: manifest rejected")
+        return passed
+    finally:
+        shutil.rmtree(workdir)
+
+def test_timeline_pipeline():
+    """Test the fls | mactime pipeline with stub tools on PATH."""
+    print("Testing timeline pipeline...")
+    import skat
+    
+    tool = skat.SleuthKitAutomationTool()
+    workdir = tempfile.mkdtemp()
+    tool._reports_prefix = workdir + os.sep
+    # Larger than a pipe buffer so an early mactime exit breaks the pipe
+    body = b"".join(b"0|/file_%d|%d-128-1|r/rrw-r--r--|0|0|10|1|2|3|4\n" % (i, i)
+                    for i in range(50000))
+    body_path = os.path.join(workdir, "body.in")
+    with open(body_path, "wb") as f:
+        f.write(body)
+    
+    def stub(name, script):
+        path = os.path.join(workdir, name)
+        with open(path, "w") as f:
+            f.write(f"#!/bin/sh\n{script}\n")
+        os.chmod(path, 0o755)
+    
+    path = os.environ["PATH"]
+    os.environ["PATH"] = workdir + os.pathsep + path
+    try:
+        passed = True
+        stub("fls", f"exec cat '{body_path}'")
+        for case, mactime, expected in (("mactime succeeds", "exec cat", body),
+                                        ("mactime exits early", "exit 3", None)):
+            stub("mactime", mactime)
+            timeline_file = tool.timeline_analysis("image.dd", stem=case.replace(" ", "_"))
+            with open(f"{workdir}/body_file_{case.replace(' ', '_')}_{tool.timestamp}", "rb") as f:
+                body_copy = f.read()
+            timeline = None
+            if timeline_file:
+                with open(timeline_file, "rb") as f:
+                    timeline = f.read()
+            
+            if body_copy != body:
+                print(f"✗ {case}: body file is incomplete")
+                passed = False
+            elif timeline != expected:
+                print(f"✗ {case}: unexpected timeline result")
+                passed = False
+            else:
+                print(f"✓ {case}: body file complete and result correct")
+        return passed
+    finally:
+        os.environ["PATH"] = path
+        shutil.rmtree(workdir)
+
+def test_body_file_listing():
+    """Test deriving the file listing from a timeline body file."""
+    print("Testing body file listing...")
+    import skat
+    
+    tool = skat.SleuthKitAutomationTool()
+    # Names are raw bytes in a body file and need not be valid UTF-8
+    body = (
+        b"0|/etc|11-144-1|d/drwxr-xr-x|0|0|4096|1|2|3|4\n"
+        b"0|/etc/passwd|12-128-1|r/rrw-r--r--|0|0|100|1|2|3|4\n"
+        b"0|/etc/passwd ($FILE_NAME)|12-48-2|r/rrw-r--r--|0|0|100|1|2|3|4\n"
+        b"\n"
+        b"not a body line\n"
+        b"0|/old.txt (deleted)|13-128-1|r/rrw-r--r--|0|0|10|1|2|3|4\n"
+        b"0|/tmp/a|b.txt (deleted-realloc)|14-128-1|r/rrw-r--r--|0|0|10|1|2|3|4\n"
+        b"0|/bad\xff\xfename|15-128-1|r/rrw-r--r--|0|0|10|1|2|3|4\n"
+    )
+    expected = [
+        b"d/d 11-144-1:\t/etc",
+        b"r/r 12-128-1:\t/etc/passwd",
+        b"r/r * 13-128-1:\t/old.txt",
+        b"r/r * 14-128-1(realloc):\t/tmp/a|b.txt",
+        b"r/r 15-128-1:\t/bad\xff\xfename",
+    ]
+    
+    workdir = tempfile.mkdtemp()
+    try:
+        body_file = os.path.join(workdir, "body")
+        output_file = os.path.join(workdir, "filelist.txt")
+        with open(body_file, "wb") as f:
+            f.write(body)
+        tool._write_file_list(body_file, output_file, "disk.img")
+        with open(output_file, "rb") as f:
+            entries = f.read().splitlines()[2:]
+        
+        if entries == expected:
+            print("✓ File listing derived correctly")
+            return True
+        else:
+            print(f"✗ Unexpected file listing: {entries}")
+            return False
+    finally:
+        shutil.rmtree(workdir)
+
 def test_directory_structure():
     """Test if required directories exist."""
     print("Testing directory structure...")
@@ -89,6 +299,10 @@ def main():
         test_imports,
         test_help_command,
         test_verify_command,
+        test_acquire_round_trip,
+        test_batch_acquisition,
+        test_timeline_pipeline,
+        test_body_file_listing,
         test_directory_structure,
         test_sample_file
     ]